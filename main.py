@@ -1,11 +1,38 @@
+import os
+
+import orjson
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
+
+# En produccion (ENV=prod) no se sirven /docs, /redoc ni /openapi.json, asi no se construye el esquema de OpenAPI
+PRODUCTION = os.getenv('ENV') == 'prod'
 
 # Inicializamos la variable con una instancia de fastAPI, de esta manera se crea un objeto de la clase fastAPI y se asigna
-# la variable app
-app = FastAPI()
-
-# Path operation decorator, este decorador utiliza el metodo .get() para modificar la funcion home, que será el lugar al cual 
-# ingresaran los usuarios de nuesta app y retorna un archivo JSON
-@app.get('/')
-def home():
-    return {'Hello':'World'}
\ No newline at end of file
+# la variable app. Usamos ORJSONResponse como respuesta por defecto para serializar los JSON con orjson en lugar del
+# modulo json de la libreria estandar
+app = FastAPI(
+    default_response_class=ORJSONResponse,
+    openapi_url=None if PRODUCTION else '/openapi.json',
+    docs_url=None if PRODUCTION else '/docs',
+    redoc_url=None if PRODUCTION else '/redoc',
+)
+
+# La respuesta de home es siempre la misma, asi que la serializamos una sola vez al cargar el modulo
+HOME_BODY = orjson.dumps({'Hello':'World'})
+
+# home se registra como una ruta de Starlette y no con el decorador @app.get(), de esta manera la peticion no pasa por la
+# resolucion de dependencias ni la validacion de FastAPI. Es el lugar al cual ingresaran los usuarios de nuesta app y
+# retorna un archivo JSON. Es async porque no hace I/O bloqueante, asi se ejecuta directamente en el event loop en lugar
+# de enviarla al threadpool
+async def home(request):
+    # Se crea un Response nuevo en cada peticion para no compartir headers mutables entre peticiones
+    return Response(HOME_BODY, media_type='application/json')
+
+app.add_route('/', home, include_in_schema=False)
+
+
+# Al ejecutar el archivo directamente con python main.py se levanta el servidor con uvloop y httptools
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(app, loop='uvloop', http='httptools')